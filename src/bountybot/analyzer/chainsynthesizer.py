@@ -1,5 +1,30 @@
 """Rule-based attack chain synthesis based on nuclei findings."""
 
+import re
+from collections import defaultdict
+from itertools import product
+
+from bountybot.scanner.findings import extract_fields
+
+# Roles that feed the rule engine directly; anything else may still qualify as SQLi.
+RULE_ROLES = frozenset({'Login/Auth Endpoint', 'File Upload', 'Admin Panel', 'Debug/Logging'})
+SQLI_BUCKET = 'SQL Injection'
+
+# Name substrings and tags marking a finding as SQLi; the name matcher is compiled once.
+SQLI_NAME_MARKERS = ("sql injection",)
+SQLI_TAGS = frozenset({"sqli"})
+_SQLI_NAME_RE = re.compile("|".join(map(re.escape, SQLI_NAME_MARKERS)), re.IGNORECASE)
+
+
+def _is_sqli(name, tags):
+    """Single scan of the name plus O(1) tag probes instead of per-marker substring tests."""
+    if _SQLI_NAME_RE.search(name):
+        return True
+    if isinstance(tags, str):
+        tags = {tag.strip() for tag in tags.split(",")}
+    return any(tag in SQLI_TAGS for tag in tags)
+
+
 def synthesize_attack_paths(scan_results):
     """
     Analyze multiple vulnerabilities and propose feasible multistep attack vectors.
@@ -8,39 +33,35 @@ def synthesize_attack_paths(scan_results):
     # Accumulator for generated attack paths.
     paths = []
 
-    # Buckets for simple rule matching.
-    auth_endpoints = []
-    uploads = []
-    sqli_points = []
-    exposed_admins = []
-    debug_pages = []
-
-    role_index = {}  # Map endpoints by their inferred roles (reserved for future logic)
+    # Single pass: bucket every finding by the role (or SQLi marker) the rules care about.
+    buckets = defaultdict(list)
 
-    # Index findings by inferred role to feed the rule engine below.
     for idx, item in enumerate(scan_results):
         role = item.get('__arcanum_role', 'Unknown')
-        endpoint = item.get('matched-at', '')
-        name = item.get("info", {}).get("name", "Unnamed")
-
-        scan_results[idx]['__endpoint_idx'] = idx  # For linking later
-
-        if role == 'Login/Auth Endpoint':
-            auth_endpoints.append((idx, endpoint, name))
-        elif role == 'File Upload':
-            uploads.append((idx, endpoint, name))
-        elif role == 'Admin Panel':
-            exposed_admins.append((idx, endpoint, name))
-        elif role == 'Debug/Logging':
-            debug_pages.append((idx, endpoint, name))
-        elif "sql injection" in name.lower() or any(tag in item.get("tags", []) for tag in ["sqli"]):
-            sqli_points.append((idx, endpoint, name))
+        endpoint, name, _severity = extract_fields(item)
+        name = name or "Unnamed"
+
+        if role in RULE_ROLES:
+            buckets[role].append((idx, endpoint, name))
+        elif _is_sqli(name, item.get("tags", ())):
+            buckets[SQLI_BUCKET].append((idx, endpoint, name))
+
+    uploads = buckets['File Upload']
+    auth_endpoints = buckets['Login/Auth Endpoint']
+    exposed_admins = buckets['Admin Panel']
+    debug_pages = buckets['Debug/Logging']
+    sqli_points = buckets[SQLI_BUCKET]
 
     # 🧠 Strategy Rules Engine - Basic Examples Follow
 
     # 1️⃣ Chain: File Upload + Auth Defects => Privilege Escalation Vector
-    for upload_idx, u_path, u_name in uploads:
-        for auth_idx, auth_path, auth_name in auth_endpoints:
+    if uploads and auth_endpoints:
+        # Several templates can fire on the same URL; emit one chain per endpoint pair.
+        seen_pairs = set()
+        for (upload_idx, u_path, u_name), (auth_idx, auth_path, auth_name) in product(uploads, auth_endpoints):
+            if (u_path, auth_path) in seen_pairs:
+                continue
+            seen_pairs.add((u_path, auth_path))
             paths.append({
                 'id': f'path_{len(paths)+1}',
                 'name': 'Web Shell via Weak Auth',
@@ -53,31 +74,31 @@ def synthesize_attack_paths(scan_results):
             })
 
     # 2️⃣ Debug Page Revealing Secrets + Internal Endpoints -> Information Leakage Cascade
-    for dbg_idx, d_path, d_name in debug_pages:
-        combined = [(dbg_idx, d_path)] + [(idx, ep) for idx, ep, nm in exposed_admins]
-        if combined:
+    # Without an exposed admin panel there is nothing to chain the debug page to.
+    if exposed_admins:
+        admin_steps = [idx for idx, ep, nm in exposed_admins]
+        for dbg_idx, d_path, d_name in debug_pages:
             paths.append({
                 'id': f'path_{len(paths)+1}',
                 'name': 'Internal Recon Lead via Debug Info',
                 'description': (
                     f"The debug page located at '{d_path}' reveals internal configurations and exposed admin panels."
                 ),
-                'steps': [step[0] for step in combined],
+                'steps': [dbg_idx] + admin_steps,
                 'risk_score': 60
             })
 
     # 3️⃣ SQLi Leads to Credential Theft Enabling Access to Protected Services
+    auth_steps = [a_i for a_i, ap, anm in auth_endpoints]
     for sql_idx, s_path, s_name in sqli_points:
-        combined_with_auth = [(sql_idx, s_path)] + [(a_i, ap) for a_i, ap, anm in auth_endpoints]
-        if combined_with_auth:
-            paths.append({
-                'id': f'path_{len(paths)+1}',
-                'name': 'Database Breach to Session Stealing',
-                'description': (
-                    f"SQL Injection at '{s_path}' combined with access to login endpoints allows credential leaks leading to impersonation attacks."
-                ),
-                'steps': [step[0] for step in combined_with_auth],
-                'risk_score': 95
-            })
+        paths.append({
+            'id': f'path_{len(paths)+1}',
+            'name': 'Database Breach to Session Stealing',
+            'description': (
+                f"SQL Injection at '{s_path}' combined with access to login endpoints allows credential leaks leading to impersonation attacks."
+            ),
+            'steps': [sql_idx] + auth_steps,
+            'risk_score': 95
+        })
 
     return paths
@@ -0,0 +1,70 @@
+"""Role classification phase shared by the assessment pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+
+from bountybot.scanner.intelligence import determine_endpoint_role
+
+# Findings per worker-thread batch; large enough to amortize thread hand-off.
+BATCH_SIZE = 256
+
+# Roles memoized per (template-id, matched-at); cleared wholesale once full.
+ROLE_CACHE_SIZE = 4096
+_ROLE_CACHE: dict[tuple[str, str], str] = {}
+
+
+def role_for(finding: dict, *, _prepared: tuple[str, set[str]] | None = None) -> str:
+    """
+    Return the endpoint role for a finding, reusing earlier results for the same
+    template firing on the same URL.
+
+    Template metadata (name, description, tags) is fixed per template-id, so the
+    pair fully determines the role. Findings without a template-id are not cached.
+    `_prepared` is handed to `determine_endpoint_role` on a cache miss.
+    """
+
+    template_id = finding.get("template-id")
+    if not template_id:
+        return determine_endpoint_role(finding, _prepared=_prepared)
+
+    key = (template_id, finding.get("matched-at") or "")
+    role = _ROLE_CACHE.get(key)
+    if role is None:
+        if len(_ROLE_CACHE) >= ROLE_CACHE_SIZE:
+            _ROLE_CACHE.clear()
+        role = _ROLE_CACHE[key] = determine_endpoint_role(finding, _prepared=_prepared)
+    return role
+
+
+def clear_role_cache() -> None:
+    """Forget every memoized role, e.g. between unrelated scans or tests."""
+
+    _ROLE_CACHE.clear()
+
+
+def classify_findings(findings: list[dict]) -> list[dict]:
+    """Attach an inferred `__arcanum_role` to each finding in place and return them."""
+
+    for finding in findings:
+        finding["__arcanum_role"] = role_for(finding)
+    return findings
+
+
+async def classify_findings_async(
+    findings: list[dict], *, batch_size: int = BATCH_SIZE
+) -> list[dict]:
+    """Classify findings in worker-thread batches so the event loop stays responsive."""
+
+    batches = [findings[i : i + batch_size] for i in range(0, len(findings), batch_size)]
+    await asyncio.gather(*(asyncio.to_thread(classify_findings, batch) for batch in batches))
+    return list(findings)
+
+
+__all__ = [
+    "BATCH_SIZE",
+    "classify_findings",
+    "classify_findings_async",
+    "clear_role_cache",
+    "role_for",
+]
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from pathlib import Path
+from collections import Counter
 
 import click
 
 from bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
+from bountybot.analyzer.classifier import role_for
 from bountybot.data.model import init_db, retrieve_successful_chains
 from bountybot.reporting.bounty_writer import write_bounty_report
-from bountybot.scanner.intelligence import determine_endpoint_role, infer_insights
+from bountybot.reporting.json_output import write_json
+from bountybot.scanner.findings import extract_fields
+from bountybot.scanner.intelligence import classify_finding
 from bountybot.tools.runner import run_all_tools
 
 
@@ -25,12 +27,20 @@ def main(url: str) -> None:
 
 
 async def _async_main(url: str) -> None:
-    # Ensure the SQLite backing store exists before logging anything.
-    init_db()
+    # Create the SQLite backing store in a worker thread while the scans run.
+    db_ready = asyncio.create_task(asyncio.to_thread(init_db))
     click.echo("[🔍] Launching Multiscan Pentest Suite...")
 
-    # Fan out to all tools and collect their results.
-    all_results = await run_all_tools(url)
+    try:
+        # Fan out to all tools and collect their results.
+        all_results = await run_all_tools(url)
+    except BaseException:
+        # Don't leave the schema task orphaned (and its errors unretrieved) if the scan fails.
+        db_ready.cancel()
+        await asyncio.gather(db_ready, return_exceptions=True)
+        raise
+    # Nothing below may log to the database until the schema exists.
+    await db_ready
 
     nuclei_results = all_results.get("nuclei", [])
     amass_results = all_results.get("amass", [])
@@ -50,50 +60,48 @@ def process_findings(target: str, findings: list[dict]) -> None:
         click.echo("\n[-] No issues found with the selected profile.")
         return
 
-    click.echo("\n🔍 Findings List\n" + "=" * 40)
+    # Build the whole report first and emit it in one write instead of one per line.
+    lines: list[str] = ["\n🔍 Findings List\n" + "=" * 40]
 
-    severity_counts: dict[str, int] = {}
-    role_counts: dict[str, int] = {}
+    severity_counts: Counter[str] = Counter()
+    role_counts: Counter[str] = Counter()
 
     for item in findings:
         # Basic nuclei metadata extraction.
         template_id = item.get("template-id", "unknown")
         matcher_name = item.get("matcher-name") or ""
-        matched_at = item.get("matched-at", "")
+        matched_at, name, severity = extract_fields(item)
+        severity = (severity or "unknown").capitalize()
+        name = name or "[Unnamed Template]"
 
-        info = item.get("info", {}) or {}
-        severity = (info.get("severity") or "unknown").capitalize()
-        name = info.get("name", "[Unnamed Template]")
-
-        # Enrich with role and LLM-style insights for analyst context.
-        role_category = determine_endpoint_role(item)
+        # Enrich with role and LLM-style insights for analyst context (one text pass);
+        # roles come from the shared (template-id, matched-at) cache.
+        role_category, insights = classify_finding(item, role_for=role_for)
         item["__arcanum_role"] = role_category
 
-        insights = infer_insights(template_id, item)
         display_title = f"{name} ({matcher_name}) [{severity}]".strip()
 
-        click.echo(f"\n📌 {display_title}")
-        click.echo(f"   Location: {matched_at or 'Unknown'}")
-        click.echo(f"   Matched By: {template_id}")
-        click.echo(f"   Detected Role: {role_category}")
+        lines.append(f"\n📌 {display_title}")
+        lines.append(f"   Location: {matched_at or 'Unknown'}")
+        lines.append(f"   Matched By: {template_id}")
+        lines.append(f"   Detected Role: {role_category}")
 
         if insights:
-            click.echo(f"   Intelligence Tags: {', '.join(insights)}")
+            lines.append(f"   Intelligence Tags: {', '.join(insights)}")
 
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        role_counts[role_category] = role_counts.get(role_category, 0) + 1
+        severity_counts[severity] += 1
+        role_counts[role_category] += 1
 
-    click.echo("\n🧠 Endpoint Role Distribution")
-    click.echo("=" * 40)
-    for role, count in sorted(role_counts.items(), key=lambda kv: (-kv[1], kv[0])):
-        click.echo(f"{role}: {count}")
+    lines.append("\n🧠 Endpoint Role Distribution")
+    lines.append("=" * 40)
+    lines.extend(f"{role}: {count}" for role, count in role_counts.most_common())
 
-    click.echo("\n📊 Summary")
-    click.echo("=" * 40)
-    for severity, count in sorted(severity_counts.items(), key=lambda kv: (-kv[1], kv[0])):
-        click.echo(f"{severity}: {count}")
+    lines.append("\n📊 Summary")
+    lines.append("=" * 40)
+    lines.extend(f"{severity}: {count}" for severity, count in severity_counts.most_common())
 
-    click.echo(f"\nTotal Issues Found: {len(findings)}")
+    lines.append(f"\nTotal Issues Found: {len(findings)}")
+    click.echo("\n".join(lines))
 
     render_attack_chains(findings)
 
@@ -117,11 +125,12 @@ def render_attack_chains(findings: list[dict]) -> None:
             click.echo(f"\n🔹 [{score}% Risk] {name}")
             click.echo(description)
 
-        bounty_path = Path("bounty_reports.json")
-        bounty_path.write_text(json.dumps(bounty_reports, indent=2))
+        bounty_path = write_json("bounty_reports.json", bounty_reports)
         click.echo(f"\n[+] Wrote {bounty_path} with synthesized drafts.")
     else:
         click.echo("No multi-step attack paths detected based on current findings.")
+        # History only adds context to fresh chains; skip the database round-trip.
+        return
 
     known_good_chains = retrieve_successful_chains()
 
@@ -136,13 +145,13 @@ def render_attack_chains(findings: list[dict]) -> None:
 def generate_bounty_files(chains: list[dict]) -> list[dict]:
     """Produce bounty draft content for each synthesized attack chain."""
 
-    reports: list[dict] = []
-    for chain in chains:
-        title = chain.get("name", "Unnamed Attack Chain")
-        full_desc = chain.get("description", "No description provided.")
-        rep = write_bounty_report(title=title, summary=full_desc)
-        reports.append(rep)
-    return reports
+    return [
+        write_bounty_report(
+            title=chain.get("name", "Unnamed Attack Chain"),
+            summary=chain.get("description", "No description provided."),
+        )
+        for chain in chains
+    ]
 
 if __name__ == "__main__":
     main()
@@ -2,42 +2,87 @@
 
 import sqlite3
 import json
+import threading
 from datetime import datetime
 
 DB_PATH = "arcanum_memory.db"  # Local SQLite file used for recording simulated successes.
 
-def init_db():
-    """Ensure the attack_success_log table exists."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS attack_success_log
+_CREATE_SQL = '''CREATE TABLE IF NOT EXISTS attack_success_log
                  (id INTEGER PRIMARY KEY,
                  timestamp TEXT,
                  chain_description TEXT,
                  result TEXT,
-                 tags TEXT)''')
-    conn.commit()
-    conn.close()
+                 tags TEXT)'''
+_INSERT_SQL = "INSERT INTO attack_success_log (timestamp, chain_description, result, tags) VALUES (?, ?, ?, ?)"
+_SELECT_SQL = "SELECT chain_description, tags FROM attack_success_log WHERE result=?"
+
+# One shared connection per process; opened lazily so importing never touches disk.
+# It is tied to the DB_PATH it was opened with and reopened if DB_PATH changes.
+_CONN = None
+_CONN_PATH = None
+_CONN_LOCK = threading.Lock()
+
+
+def _connection():
+    """Return the shared autocommit connection for DB_PATH, opening it on first use."""
+    global _CONN, _CONN_PATH
+    if _CONN is None or _CONN_PATH != DB_PATH:
+        with _CONN_LOCK:
+            if _CONN is None or _CONN_PATH != DB_PATH:
+                if _CONN is not None:
+                    _CONN.close()
+                conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                _CONN, _CONN_PATH = conn, DB_PATH
+    return _CONN
+
+
+def close_db():
+    """Close the shared connection; the next call reopens it against DB_PATH."""
+    global _CONN, _CONN_PATH
+    with _CONN_LOCK:
+        if _CONN is not None:
+            _CONN.close()
+        _CONN, _CONN_PATH = None, None
+
+
+def init_db():
+    """Ensure the attack_success_log table exists."""
+    conn = _connection()
+    with _CONN_LOCK:
+        conn.execute(_CREATE_SQL)
 
 
 def log_attack_result(chain_description, success, tags):
     """Record a simulated attack result along with lightweight tags."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    log_attack_results_bulk([(chain_description, success, tags)])
+
+
+def log_attack_results_bulk(rows):
+    """Record many (chain_description, result, tags) rows in a single transaction."""
     now = datetime.now().isoformat()
-    c.execute("INSERT INTO attack_success_log (timestamp, chain_description, result, tags) VALUES (?, ?, ?, ?)",
-              (now, chain_description, success, json.dumps(tags)))
-    conn.commit()
-    conn.close()
+    params = [(now, desc, result, json.dumps(tags)) for desc, result, tags in rows]
+    if not params:
+        return
+
+    conn = _connection()
+    with _CONN_LOCK:
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT_SQL, params)
+            conn.execute("COMMIT")
+        except BaseException:
+            # Never leave the shared autocommit connection inside an open transaction.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
 
 
 def retrieve_successful_chains(threshold=70):
     """Fetch previously successful chains for display; threshold reserved for future scoring."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT chain_description, tags FROM attack_success_log WHERE result=?", ("success",))
-    results = c.fetchall()
-    conn.close()
+    results = _connection().execute(_SELECT_SQL, ("success",)).fetchall()
 
     output = []
     for desc, tags_json in results:
@@ -47,3 +92,13 @@ def retrieve_successful_chains(threshold=70):
             continue
 
     return output
+
+
+__all__ = [
+    "DB_PATH",
+    "close_db",
+    "init_db",
+    "log_attack_result",
+    "log_attack_results_bulk",
+    "retrieve_successful_chains",
+]
@@ -5,19 +5,24 @@ payload simulation, and report generation for a single target URL.
 Each phase is intentionally linear so it is easy to follow and modify.
 """
 
+import re
 import sys
-import json
 import asyncio
+from pathlib import Path
 
-from src.bountybot.tools.runner import run_all_tools
-from src.bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
-from src.bountybot.exploits.payload_builder import (
+from bountybot.tools.runner import run_all_tools
+from bountybot.analyzer.classifier import classify_findings_async
+from bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
+from bountybot.exploits.payload_builder import (
     generate_for_vulnerability_chain,
     simulate_attack_attempt,
 )
-from src.bountybot.reporting.bounty_writer import write_bounty_report
-from src.bountybot.reporting.breach_summary_builder import summarize_attack_path
-from src.bountybot.scanner.intelligence import determine_endpoint_role
+from bountybot.reporting.bounty_writer import write_bounty_report
+from bountybot.reporting.breach_summary_builder import summarize_attack_path
+from bountybot.reporting.json_output import write_json
+
+# Anything outside [a-z0-9] collapses to "_" so path names are safe as filenames.
+_FILENAME_UNSAFE = re.compile(r'[^a-z0-9]+')
 
 
 async def autonomous_assessment_pipeline(target_url):
@@ -27,11 +32,7 @@ async def autonomous_assessment_pipeline(target_url):
     nuclei_findings = results.get('nuclei', [])
     
     # Phase 2: Role Classification — enrich each finding with a coarse role for later chaining.
-    classified_findings = []
-    for finding in nuclei_findings:
-        role = determine_endpoint_role(finding)
-        finding['__arcanum_role'] = role
-        classified_findings.append(finding)
+    classified_findings = await classify_findings_async(nuclei_findings)
 
     # Phase 3: Pathway Synthesis — turn isolated findings into multi-step attack paths.
     attack_paths = synthesize_attack_paths(classified_findings)
@@ -59,31 +60,40 @@ async def autonomous_assessment_pipeline(target_url):
     ]
 
     # Phase 6: Save Results — persist everything for later review and consumption.
-    with open('assessment_output.json', 'w') as f:
-        json.dump({
-            'target': target_url,
-            'findings': classified_findings,
-            'attack_paths': attack_paths,
-            'tested_payloads': tested_payloads,
-            'bounty_reports': bounty_docs
-        }, f, indent=2)
+    write_json('assessment_output.json', {
+        'target': target_url,
+        'findings': classified_findings,
+        'attack_paths': attack_paths,
+        'tested_payloads': tested_payloads,
+        'bounty_reports': bounty_docs
+    })
 
     print("[✅] Autonomous Assessment Complete: Saved as assessment_output.json")
 
     # Save markdown-based summaries — each synthesized path gets a human-readable summary.
-    summaries_written = []
+    summaries_written = [_summary_filename(path) for path in attack_paths]
+    # Paths sharing a name map to one file; keep the last, as sequential writes would.
+    latest_by_file = dict(zip(summaries_written, attack_paths))
+    await asyncio.gather(*(
+        asyncio.to_thread(_write_summary, filename, path)
+        for filename, path in latest_by_file.items()
+    ))
 
-    for path in attack_paths:
-        # Generate a human-ready markdown summary for each synthesized path.
-        summary_md = summarize_attack_path(path)
-        filename = f"{path['name'].replace(' ', '_').lower()}_summary.md"
-        with open(filename, 'w') as f:
-            f.write(summary_md)
-        summaries_written.append(filename)
-        
     print(f"[✅] Generated Markdown Summaries: {', '.join(summaries_written)}")
 
 
+def _summary_filename(path):
+    return _FILENAME_UNSAFE.sub('_', path['name'].lower()) + '_summary.md'
+
+
+def _write_summary(filename, path):
+    # Generate a human-ready markdown summary for a synthesized path and save it.
+    Path(filename).write_bytes(summarize_attack_path(path).encode('utf-8'))
+
+
+__all__ = ["autonomous_assessment_pipeline"]
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python -m bountybot.executor TARGET_URL")
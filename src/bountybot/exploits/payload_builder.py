@@ -3,7 +3,7 @@
 import time
 from random import choices
 
-from bountybot.data.model import log_attack_result
+from bountybot.data.model import log_attack_results_bulk
 
 def generate_for_vulnerability_chain(chain, findings):
     """
@@ -64,6 +64,7 @@ def simulate_attack_attempt(payloads, target_url):
     Run a lightweight simulation for each payload+chain pair and log decisions.
     """
     simulation_results = []
+    successes = []
 
     for payload_entry in payloads:
         # Payloads can be tuples (payload, chain) or payload-only.
@@ -77,12 +78,12 @@ def simulate_attack_attempt(payloads, target_url):
         print(sim_eval['log_entry'])
 
         if sim_eval['outcome'] == 'accepted':
-            # Persist "wins" so history can be surfaced to the analyst.
-            log_attack_result(
+            # Collect "wins" so history can be surfaced to the analyst.
+            successes.append((
                 chain.get("name", "unknown"),
                 "successful_simulation",
                 ["tested", pl_details.get('type', 'unknown')],
-            )
+            ))
 
         simulation_results.append({
             "chain": chain,
@@ -91,6 +92,9 @@ def simulate_attack_attempt(payloads, target_url):
             "log_entry": sim_eval["log_entry"],
         })
 
+    # Persist all wins in one transaction rather than committing per payload.
+    log_attack_results_bulk(successes)
+
     return simulation_results
 
 
@@ -4,17 +4,17 @@ This mirrors the executor flow but keeps the output in a single report file,
 useful for synchronous or CLI-driven runs.
 """
 
-import json
 from pathlib import Path
 
-from src.bountybot.tools.runner import run_all_tools
-from src.bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
-from src.bountybot.exploits.payload_builder import (
+from bountybot.tools.runner import run_all_tools
+from bountybot.analyzer.classifier import classify_findings_async
+from bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
+from bountybot.exploits.payload_builder import (
     generate_for_vulnerability_chain,
     simulate_attack_attempt,
 )
-from src.bountybot.reporting.bounty_writer import write_bounty_report
-from src.bountybot.scanner.intelligence import determine_endpoint_role
+from bountybot.reporting.bounty_writer import write_bounty_report
+from bountybot.reporting.json_output import write_json
 
 async def run_complete_assessment(target_url):
     # Run the end-to-end workflow for one target and emit a JSON report.
@@ -23,11 +23,7 @@ async def run_complete_assessment(target_url):
 
     print("[*] Analyzing Roles...")
     # Attach inferred roles to each finding so downstream synthesis has context.
-    enriched_findings = []
-    for f in findings:
-        role = determine_endpoint_role(f)
-        f['__arcanum_role'] = role
-        enriched_findings.append(f)
+    enriched_findings = await classify_findings_async(findings)
 
     print("[*] Building Attack Pathways...")
     chains = synthesize_attack_paths(enriched_findings)
@@ -56,7 +52,7 @@ async def run_complete_assessment(target_url):
     report_path = Path(
         f"report_{target_url.replace('://', '_').replace('/', '')}.json"
     )
-    report_path.write_text(json.dumps(report_output, indent=2))
+    write_json(report_path, report_output)
 
     print("[✓] Assessment complete.")
 
@@ -66,3 +62,6 @@ async def run_nuclei_scan(target_url):
     # Tool runner returns a dict keyed by tool name; we only need nuclei here.
     tool_results = await run_all_tools(target_url)
     return tool_results.get("nuclei", [])
+
+
+__all__ = ["run_complete_assessment", "run_nuclei_scan"]
@@ -20,13 +20,17 @@ Describe what an attacker could do.
 Provide a fix suggestion.
 """
 
+# Split once so reports are assembled by concatenation rather than str.format per chain.
+_HEAD, _TAIL = DEFAULT_PROMPT.split("{summary}")
+_PREVIEW_LEN = 100
+
 def write_bounty_report(title, summary, severity='high'):
     """Compose a bounty report skeleton; in production this would call an LLM."""
-    prompt = DEFAULT_PROMPT.format(summary=summary)
+    prompt = _HEAD + summary + _TAIL
     # Here, we'd ideally plug in a model call like using Ollama or OpenAI API
     # But for prototype purposes, return a static structure + the prompt
 
-    response = simulate_llm_response(prompt)
+    response = simulate_llm_response(summary)
 
     return {
         'title': title,
@@ -35,11 +39,13 @@ def write_bounty_report(title, summary, severity='high'):
         'generated_content': response
     }
 
-def simulate_llm_response(prompt):
+def simulate_llm_response(summary):
     # For demo only; replace with actual API or local inference
+    # Only the prompt preview is echoed, so build just that slice from the summary.
+    preview = (_HEAD + summary[:_PREVIEW_LEN - len(_HEAD)] + _TAIL)[:_PREVIEW_LEN]
     return f"""
 **Report Title**: Vulnerability Detected
 
-**Summary**: {prompt[:100]}...
+**Summary**: {preview}...
 ...Full generated content would appear here via LLM inference.
 """
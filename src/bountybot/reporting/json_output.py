@@ -0,0 +1,33 @@
+"""JSON report serialization with an optional fast path.
+
+`orjson` is used when installed (it encodes straight to UTF-8 bytes in C);
+otherwise the stdlib `json` module produces the same indented layout.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+    import json
+
+__all__ = ["dumps_json", "write_json"]
+
+
+def dumps_json(obj: object) -> bytes:
+    """Serialize `obj` as two-space indented UTF-8 JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def write_json(path: str | Path, obj: object) -> Path:
+    """Write `obj` to `path` as indented JSON and return the path written."""
+
+    target = Path(path)
+    target.write_bytes(dumps_json(obj))
+    return target
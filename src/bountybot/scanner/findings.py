@@ -0,0 +1,23 @@
+"""Shared accessors for raw nuclei finding dicts."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Read-only stand-in for a missing "info" block; avoids a fresh {} per finding.
+EMPTY_INFO: Mapping[str, object] = MappingProxyType({})
+
+
+def finding_info(finding: dict) -> Mapping[str, object]:
+    """Return the finding's `info` block, or the shared empty mapping."""
+    return finding.get("info") or EMPTY_INFO
+
+
+def extract_fields(finding: dict) -> tuple[str, str | None, str | None]:
+    """Return `(matched-at, template name, severity)` in one pass; missing values are None/""."""
+    info = finding_info(finding)
+    return finding.get("matched-at") or "", info.get("name"), info.get("severity")
+
+
+__all__ = ["EMPTY_INFO", "extract_fields", "finding_info"]
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import re
+from collections.abc import Callable, Iterable
+from itertools import chain
 
-ROLE_PATTERNS: list[tuple[str, set[str]]] = [
+from .findings import finding_info
+
+try:  # Optional Aho-Corasick C extension; a compiled regex is used otherwise.
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on the environment
+    ahocorasick = None
+
+ROLE_PATTERNS: list[tuple[str, frozenset[str]]] = [
     (
         "File Upload",
-        {
+        frozenset({
             "upload",
             "multipart",
             "file upload",
@@ -15,11 +24,11 @@ ROLE_PATTERNS: list[tuple[str, set[str]]] = [
             "avatar",
             "attachment",
             "media upload",
-        },
+        }),
     ),
     (
         "Login/Auth Endpoint",
-        {
+        frozenset({
             "login",
             "sign-in",
             "signin",
@@ -30,22 +39,22 @@ ROLE_PATTERNS: list[tuple[str, set[str]]] = [
             "token",
             "password",
             "session",
-        },
+        }),
     ),
     (
         "Admin Panel",
-        {
+        frozenset({
             "admin",
             "dashboard",
             "control panel",
             "console",
             "cms",
             "backoffice",
-        },
+        }),
     ),
     (
         "Debug/Logging",
-        {
+        frozenset({
             "debug",
             "trace",
             "log",
@@ -53,24 +62,131 @@ ROLE_PATTERNS: list[tuple[str, set[str]]] = [
             "status page",
             "metrics",
             "prometheus",
-        },
+        }),
     ),
 ]
 
-INSIGHT_PATTERNS: list[tuple[set[str], str]] = [
-    ({"sqli", "sql injection", "blind-sql"}, "SQLi Suspected"),
-    ({"xss", "cross-site scripting"}, "XSS Exposure"),
-    ({"lfi", "rfi", "file inclusion", "directory traversal"}, "File Disclosure Risk"),
-    ({"rce", "command-injection", "remote code execution"}, "RCE Potential"),
-    ({"csrf", "cross-site request forgery"}, "CSRF Vector"),
-    ({"ssrf", "request forgery"}, "SSRF Potential"),
-    ({"open-redirect", "redirect"}, "Open Redirect"),
-    ({"token", "cookie", "jwt"}, "Session Token Exposure"),
-    ({"bucket", "s3", "storage"}, "Storage Exposure"),
-    ({"debug", "stacktrace"}, "Debug Information Leak"),
+INSIGHT_PATTERNS: list[tuple[frozenset[str], str]] = [
+    (frozenset({"sqli", "sql injection", "blind-sql"}), "SQLi Suspected"),
+    (frozenset({"xss", "cross-site scripting"}), "XSS Exposure"),
+    (frozenset({"lfi", "rfi", "file inclusion", "directory traversal"}), "File Disclosure Risk"),
+    (frozenset({"rce", "command-injection", "remote code execution"}), "RCE Potential"),
+    (frozenset({"csrf", "cross-site request forgery"}), "CSRF Vector"),
+    (frozenset({"ssrf", "request forgery"}), "SSRF Potential"),
+    (frozenset({"open-redirect", "redirect"}), "Open Redirect"),
+    (frozenset({"token", "cookie", "jwt"}), "Session Token Exposure"),
+    (frozenset({"bucket", "s3", "storage"}), "Storage Exposure"),
+    (frozenset({"debug", "stacktrace"}), "Debug Information Leak"),
 ]
 
 
+def _build_keyword_labels() -> dict[str, list[str]]:
+    """Flatten ROLE_PATTERNS and INSIGHT_PATTERNS into keyword -> labels."""
+    index: dict[str, list[str]] = {}
+    for role, keywords in ROLE_PATTERNS:
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(role)
+    for keywords, label in INSIGHT_PATTERNS:
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(label)
+    return index
+
+
+# Short or ambiguous keywords only count as whole words ("log" must not fire inside
+# "catalog", nor "token" inside "tokenizer"); a plural "s" is still accepted. Every
+# other keyword is distinctive enough to match as a substring ("phpmyadmin", "uploader").
+WHOLE_WORD_KEYWORDS = frozenset({"log", "token", "sso", "trace", "s3", "rce", "lfi", "rfi"})
+
+# "_" counts as a separator so snake_case identifiers like "log_file" still match.
+_LEADING = r"(?<![^\W_])"
+_TRAILING = r"s?(?![^\W_])"
+_TRAILING_RE = re.compile(_TRAILING)
+
+
+def _keyword_pattern(keyword: str) -> str:
+    escaped = re.escape(keyword)
+    if keyword in WHOLE_WORD_KEYWORDS:
+        return _LEADING + escaped + "(?=" + _TRAILING + ")"
+    return escaped
+
+
+def _build_keyword_regex(keywords: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compile every keyword into one alternation wrapped in a lookahead.
+
+    Longest keywords are tried first, so each offset reports the longest keyword
+    matching there; the zero-width lookahead lets matches overlap. The boundary
+    assertions are zero-width too, so the group captures just the keyword text.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(_keyword_pattern, ordered)) + "))")
+
+
+def _build_prefix_closure(keywords: Iterable[str]) -> dict[str, tuple[str, ...]]:
+    """Map each keyword to itself plus every shorter keyword that is its prefix."""
+    keywords = list(keywords)
+    return {
+        keyword: tuple(other for other in keywords if keyword.startswith(other))
+        for keyword in keywords
+    }
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum()
+
+
+def _keyword_hit(text: str, keyword: str, start: int) -> bool:
+    """True when `keyword` found at `start` counts, i.e. it is distinctive or a whole word."""
+    if keyword not in WHOLE_WORD_KEYWORDS:
+        return True
+    return (start == 0 or not _is_word_char(text[start - 1])) and (
+        _TRAILING_RE.match(text, start + len(keyword)) is not None
+    )
+
+
+_KEYWORD_LABELS = _build_keyword_labels()
+# Lower rank wins when a finding matches several roles (ROLE_PATTERNS order).
+_ROLE_RANK = {role: rank for rank, (role, _keywords) in enumerate(ROLE_PATTERNS)}
+
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORD_LABELS:
+        _AUTOMATON.add_word(_keyword, _keyword)
+    _AUTOMATON.make_automaton()
+else:
+    _KEYWORD_RE = _build_keyword_regex(_KEYWORD_LABELS)
+    # A shorter keyword at the same offset is shadowed by the longer alternative.
+    _PREFIX_CLOSURE = _build_prefix_closure(_KEYWORD_LABELS)
+
+
+def _scan(text: str) -> set[str]:
+    """Return every pattern keyword occurring in `text` using one native scan."""
+    if ahocorasick is not None:
+        return {
+            keyword
+            for end, keyword in _AUTOMATON.iter(text)
+            if _keyword_hit(text, keyword, end - len(keyword) + 1)
+        }
+
+    hits: set[str] = set()
+    for match in _KEYWORD_RE.finditer(text):
+        start = match.start()
+        hits.update(
+            keyword
+            for keyword in _PREFIX_CLOSURE[match.group(1)]
+            if _keyword_hit(text, keyword, start)
+        )
+    return hits
+
+
+def _matched_labels(text: str) -> set[str]:
+    """Map keyword hits in the text blob to role/insight labels via the reverse index."""
+    labels: set[str] = set()
+    for keyword in _scan(text):
+        labels.update(_KEYWORD_LABELS[keyword])
+    return labels
+
+
 def _ensure_iterable(value: object) -> Iterable[str]:
     """Normalize arbitrary inputs into an iterable of strings."""
     if isinstance(value, str):
@@ -82,32 +198,41 @@ def _ensure_iterable(value: object) -> Iterable[str]:
 
 def _collect_text(finding: dict) -> tuple[str, set[str]]:
     """Collapse relevant fields and tags into a lowercase blob plus a tag set."""
-    info = finding.get("info") or {}
-    fragments: list[str] = []
-
-    for candidate in (
-        finding.get("template-id"),
-        info.get("name"),
-        info.get("description"),
-        finding.get("matched-at"),
-        info.get("reference"),
-    ):
-        if candidate:
-            fragments.append(str(candidate))
+    info = finding_info(finding)
+    fragments = [
+        str(candidate).lower()
+        for candidate in (
+            finding.get("template-id"),
+            info.get("name"),
+            info.get("description"),
+            finding.get("matched-at"),
+            info.get("reference"),
+        )
+        if candidate
+    ]
 
     tag_set: set[str] = set()
-    for container in (_ensure_iterable(info.get("tags")), _ensure_iterable(finding.get("tags"))):
-        for entry in container:
-            if entry:
-                tag_set.add(str(entry).lower())
-                fragments.append(str(entry))
+    for entry in chain(_ensure_iterable(info.get("tags")), _ensure_iterable(finding.get("tags"))):
+        if entry:
+            lowered = str(entry).lower()
+            tag_set.add(lowered)
+            fragments.append(lowered)
 
-    text_blob = " ".join(fragments).lower()
-    return text_blob, tag_set
+    # Every fragment is already lowercase, so the joined blob needs no second fold.
+    return " ".join(fragments), tag_set
 
 
-def _text_contains(text: str, keywords: set[str], tags: set[str]) -> bool:
-    return any(keyword in text for keyword in keywords) or bool(tags & keywords)
+# URL-path fast path: one lookahead alternation so overlapping hits are all seen.
+# Group order is the priority order; "/basic-auth" always matched "auth" first.
+_PATH_RE = re.compile(
+    r"(?=(?P<login>login|auth)|(?P<admin>admin)|(?P<upload>upload|/image)|(?P<status>/status/))"
+)
+_PATH_GROUP_ROLES: dict[str, tuple[int, str]] = {
+    "login": (0, "Login/Auth Endpoint"),
+    "admin": (1, "Admin Panel"),
+    "upload": (2, "File Upload"),
+    "status": (3, "Status Checker/API Gate"),
+}
 
 
 def _role_from_path(path: str) -> str | None:
@@ -115,32 +240,35 @@ def _role_from_path(path: str) -> str | None:
     if not path:
         return None
 
-    if "login" in path or "auth" in path:
-        return "Login/Auth Endpoint"
-    if "admin" in path:
-        return "Admin Panel"
-    if "upload" in path or "/image" in path:
-        return "File Upload"
-    if "/basic-auth" in path:
-        return "Auth Endpoint"
-    if "/status/" in path:
-        return "Status Checker/API Gate"
-    return None
+    best: tuple[int, str] | None = None
+    for match in _PATH_RE.finditer(path):
+        candidate = _PATH_GROUP_ROLES[match.lastgroup]
+        if candidate[0] == 0:
+            return candidate[1]
+        if best is None or candidate < best:
+            best = candidate
+    return best[1] if best else None
+
 
+def determine_endpoint_role(
+    finding: dict, *, _prepared: tuple[str, set[str]] | None = None
+) -> str:
+    """
+    Infer the high-level purpose of an endpoint based on nuclei metadata.
 
-def determine_endpoint_role(finding: dict) -> str:
-    """Infer the high-level purpose of an endpoint based on nuclei metadata."""
+    `_prepared` accepts a precomputed `_collect_text(finding)` result.
+    """
 
     matched_at = (finding.get("matched-at") or "").lower()
     path_role = _role_from_path(matched_at)
     if path_role:
         return path_role
 
-    text_blob, tags = _collect_text(finding)
-
-    for role, keywords in ROLE_PATTERNS:
-        if _text_contains(text_blob, keywords, tags):
-            return role
+    text_blob, _tags = _prepared or _collect_text(finding)
+    # Tags are folded into the text blob, so scanning it also covers exact tag hits.
+    ranks = [_ROLE_RANK[label] for label in _matched_labels(text_blob) if label in _ROLE_RANK]
+    if ranks:
+        return ROLE_PATTERNS[min(ranks)][0]
 
     if "api" in text_blob or "graphql" in text_blob:
         return "API Endpoint"
@@ -150,11 +278,46 @@ def determine_endpoint_role(finding: dict) -> str:
     return "Debug/Logging"
 
 
-def infer_insights(template_id: str | None, finding: dict) -> list[str]:
-    """Produce human-friendly insight tags for a nuclei finding."""
+def infer_insights(
+    template_id: str | None,
+    finding: dict,
+    *,
+    _prepared: tuple[str, set[str]] | None = None,
+) -> list[str]:
+    """
+    Produce human-friendly insight tags for a nuclei finding.
 
-    text_blob, tags = _collect_text(finding)
-    info = finding.get("info") or {}
+    `_prepared` accepts a precomputed `_collect_text(finding)` result.
+    """
+
+    text_blob, _tags = _prepared or _collect_text(finding)
+    return _insights_from(template_id, finding, text_blob, finding.get("__arcanum_role"))
+
+
+def classify_finding(
+    finding: dict, *, role_for: Callable[..., str] | None = None
+) -> tuple[str, list[str]]:
+    """
+    Return `(role, insights)` for a finding, collecting its text only once.
+
+    A URL-path role hit still skips the keyword scan for the role, and the text
+    gathered for insights is reused otherwise. The role is not written back to
+    the finding; insights treat it as the finding's `__arcanum_role`.
+
+    `role_for` replaces `determine_endpoint_role` (e.g. a memoizing wrapper) and
+    receives the same `_prepared` keyword argument.
+    """
+
+    prepared = _collect_text(finding)
+    role = (role_for or determine_endpoint_role)(finding, _prepared=prepared)
+    return role, _insights_from(finding.get("template-id"), finding, prepared[0], role)
+
+
+def _insights_from(
+    template_id: str | None, finding: dict, text_blob: str, role: str | None
+) -> list[str]:
+    labels = _matched_labels(text_blob)
+    info = finding_info(finding)
     severity = str(info.get("severity") or "").lower()
     normalized_id = (template_id or "").lower()
 
@@ -164,8 +327,8 @@ def infer_insights(template_id: str | None, finding: dict) -> list[str]:
         if label not in insights:
             insights.append(label)
 
-    for keywords, label in INSIGHT_PATTERNS:
-        if _text_contains(text_blob, keywords, tags):
+    for _keywords, label in INSIGHT_PATTERNS:
+        if label in labels:
             add(label)
 
     if severity in {"critical", "high"}:
@@ -176,11 +339,10 @@ def infer_insights(template_id: str | None, finding: dict) -> list[str]:
     if normalized_id.startswith("cve-"):
         add("CVE Coverage")
 
-    role = finding.get("__arcanum_role")
     if role and role != "General Endpoint":
         add(f"Sensitive Role: {role}")
 
     return insights
 
 
-__all__ = ["determine_endpoint_role", "infer_insights"]
+__all__ = ["classify_finding", "determine_endpoint_role", "infer_insights"]
@@ -1,14 +1,23 @@
-"""Wrapper utilities for executing nuclei scans with curated defaults."""
+"""Wrapper utilities for executing nuclei scans with curated defaults.
+
+nuclei's JSONL output is parsed with `orjson` when it is installed and with the
+stdlib `json` module otherwise.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
-import subprocess
-import threading
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from types import MappingProxyType
+from typing import AsyncIterator, Iterable, List, Mapping, Sequence
+
+try:  # Optional: orjson decodes JSONL bytes several times faster than the stdlib.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _json_loads
 
 __all__ = [
     "DEFAULT_PROFILE",
@@ -20,6 +29,7 @@ __all__ = [
     "available_profiles",
     "build_nuclei_command",
     "run_nuclei_scan",
+    "run_nuclei_scan_async",
 ]
 
 
@@ -61,16 +71,20 @@ class ScanProfile:
 
     key: str
     description: str
-    args: List[str]
+    args: tuple[str, ...]
 
 
 DEFAULT_PROFILE = "fast"
 
+# Fixed arguments surrounding the target URL in every nuclei invocation.
+_BASE_PREFIX = ("nuclei", "-u")
+_BASE_SUFFIX = ("-silent", "-jsonl", "-no-meta", "-stats")
+
 _PROFILES: dict[str, ScanProfile] = {
     "fast": ScanProfile(
         key="fast",
         description="High-signal checks only (critical CVEs and common misconfigurations).",
-        args=[
+        args=(
             "-severity",
             "medium,high,critical",
             "-tags",
@@ -79,32 +93,35 @@ _PROFILES: dict[str, ScanProfile] = {
             "150",
             "-concurrency",
             "15",
-        ],
+        ),
     ),
     "balanced": ScanProfile(
         key="balanced",
         description="Broader coverage while still filtering to actionable template tags.",
-        args=[
+        args=(
             "-severity",
             "low,medium,high,critical",
             "-tags",
             "cve,misconfig,exposure,fuzz",
             "-rate-limit",
             "100",
-        ],
+        ),
     ),
     "thorough": ScanProfile(
         key="thorough",
         description="Full nuclei defaults (no filtering) – can take several minutes.",
-        args=[],
+        args=(),
     ),
 }
 
 
-def available_profiles() -> dict[str, ScanProfile]:
-    """Return the configured scan profiles keyed by name."""
+_PROFILES_VIEW: Mapping[str, ScanProfile] = MappingProxyType(_PROFILES)
+
 
-    return dict(_PROFILES)
+def available_profiles() -> Mapping[str, ScanProfile]:
+    """Return a read-only view of the configured scan profiles keyed by name."""
+
+    return _PROFILES_VIEW
 
 
 def build_nuclei_command(
@@ -124,19 +141,7 @@ def build_nuclei_command(
         raise ValueError(f"Unknown scan profile '{profile}'")
 
     scan_profile = _PROFILES[profile_key]
-    cmd: List[str] = [
-        "nuclei",
-        "-u",
-        url,
-        "-silent",
-        "-jsonl",
-        "-no-meta",
-        "-stats",
-    ]
-    cmd.extend(scan_profile.args)
-    if extra_args:
-        cmd.extend(extra_args)
-    return cmd
+    return [*_BASE_PREFIX, url, *_BASE_SUFFIX, *scan_profile.args, *(extra_args or ())]
 
 
 @dataclass
@@ -150,24 +155,79 @@ class NucleiScanResult:
     stderr_tail: List[str]
 
 
-def _collect_stdout(stream, bucket: List[str]) -> None:
-    for line in iter(stream.readline, ""):
-        bucket.append(line)
-    stream.close()
+# nuclei JSONL lines can embed full requests/responses; asyncio's 64 KiB default is too small.
+_STREAM_LIMIT = 16 * 1024 * 1024
+# Bytes of an over-limit line kept for diagnostics; the rest is discarded unparsed.
+_OVERSIZED_HEAD = 200
+
 
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[tuple[bytes, bool]]:
+    """
+    Yield `(line, oversized)` pairs until EOF.
 
-def _relay_stderr(stream, sink: deque[str], prefix: str = "[nuclei] ") -> None:
-    for line in iter(stream.readline, ""):
-        text = line.rstrip()
+    A line longer than `_STREAM_LIMIT` would make `async for` on the reader raise
+    and abort the scan; such lines are drained in chunks and reported by their head.
+    """
+    while True:
+        try:
+            line = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as exc:
+            if exc.partial:
+                yield exc.partial, False
+            return
+        except asyncio.LimitOverrunError as exc:
+            head = await stream.read(exc.consumed)
+            await _discard_line(stream)
+            yield head[:_OVERSIZED_HEAD], True
+            continue
+        yield line, False
+
+
+async def _discard_line(stream: asyncio.StreamReader) -> None:
+    """Consume the remainder of the current line, however long it is."""
+    while True:
+        try:
+            await stream.readuntil(b"\n")
+            return
+        except asyncio.IncompleteReadError:
+            return
+        except asyncio.LimitOverrunError as exc:
+            await stream.read(exc.consumed)
+
+
+async def _drain_stdout_json(
+    stream: asyncio.StreamReader, findings: List[dict], skipped: List[bytes]
+) -> None:
+    """Parse JSONL bytes as they arrive; both JSON backends decode UTF-8 themselves."""
+    async for raw_line, oversized in _iter_lines(stream):
+        line = raw_line.strip()
+        if oversized:
+            skipped.append(line + b"...")
+            continue
+        if not line:
+            continue
+
+        try:
+            findings.append(_json_loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):  # orjson's error subclasses the former
+            skipped.append(line)
+
+
+async def _relay_stderr(
+    stream: asyncio.StreamReader, sink: deque[str], prefix: str = "[nuclei] "
+) -> None:
+    async for raw_line, oversized in _iter_lines(stream):
+        text = raw_line.decode("utf-8", "replace").rstrip()
+        if oversized:
+            text += "..."
         if not text:
             continue
 
         sink.append(text)
         print(f"{prefix}{text}")
-    stream.close()
 
 
-def run_nuclei_scan(
+async def run_nuclei_scan_async(
     url: str,
     *,
     profile: str | None = None,
@@ -176,52 +236,43 @@ def run_nuclei_scan(
 ) -> NucleiScanResult:
     """
     Execute nuclei with sane defaults, surfacing progress and enforcing a timeout.
+
+    Both output pipes are drained on the event loop, so concurrent scans share
+    one thread instead of spawning two reader threads each.
     """
 
     command = build_nuclei_command(url, profile=profile, extra_args=extra_args)
 
     try:
-        proc = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LIMIT,
         )
     except FileNotFoundError as exc:
         raise NucleiNotInstalled("Unable to find 'nuclei' on PATH") from exc
 
-    stdout_lines: List[str] = []
+    findings: List[dict] = []
+    skipped_lines: List[bytes] = []
     stderr_tail: deque[str] = deque(maxlen=40)
 
-    stdout_thread = threading.Thread(
-        target=_collect_stdout,
-        args=(proc.stdout, stdout_lines),
-        daemon=True,
-    )
-    stderr_thread = threading.Thread(
-        target=_relay_stderr,
-        args=(proc.stderr, stderr_tail),
-        daemon=True,
-    )
-
     start = time.monotonic()
-    stdout_thread.start()
-    stderr_thread.start()
-
     try:
-        if timeout is None:
-            proc.wait()
-        else:
-            proc.wait(timeout=timeout)
-    except subprocess.TimeoutExpired as exc:
-        proc.kill()
-        stdout_thread.join(timeout=1)
-        stderr_thread.join(timeout=1)
+        await asyncio.wait_for(
+            asyncio.gather(
+                _drain_stdout_json(proc.stdout, findings, skipped_lines),
+                _relay_stderr(proc.stderr, stderr_tail),
+                proc.wait(),
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError as exc:
         raise NucleiScanTimeout(timeout, command) from exc
     finally:
-        stdout_thread.join()
-        stderr_thread.join()
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
 
     duration = time.monotonic() - start
     stderr_lines = list(stderr_tail)
@@ -229,24 +280,11 @@ def run_nuclei_scan(
     if proc.returncode not in (0, 1):
         raise NucleiScanFailed(proc.returncode, command, stderr_lines)
 
-    findings: List[dict] = []
-    skipped_lines: list[str] = []
-
-    for raw_line in stdout_lines:
-        line = raw_line.strip()
-        if not line:
-            continue
-
-        try:
-            findings.append(json.loads(line))
-        except json.JSONDecodeError:
-            skipped_lines.append(line)
-
     if skipped_lines:
         print(
             f"[nuclei] Skipped {len(skipped_lines)} non-JSON line(s) from stdout (showing last):"
         )
-        print(f"[nuclei] {skipped_lines[-1]}")
+        print(f"[nuclei] {skipped_lines[-1].decode('utf-8', 'replace')}")
 
     return NucleiScanResult(
         findings=findings,
@@ -255,3 +293,21 @@ def run_nuclei_scan(
         duration=duration,
         stderr_tail=stderr_lines,
     )
+
+
+def run_nuclei_scan(
+    url: str,
+    *,
+    profile: str | None = None,
+    timeout: float | None = 180,
+    extra_args: Sequence[str] | None = None,
+) -> NucleiScanResult:
+    """
+    Blocking wrapper around `run_nuclei_scan_async`.
+
+    Must not be called from a running event loop; await the async variant there.
+    """
+
+    return asyncio.run(
+        run_nuclei_scan_async(url, profile=profile, timeout=timeout, extra_args=extra_args)
+    )
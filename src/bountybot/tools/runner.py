@@ -1,81 +1,11 @@
-"""Mocked tool runner to avoid long-running external scans."""
+"""Tool runner entry point used by the CLI and assessment pipelines.
 
-from __future__ import annotations
-
-import asyncio
-import json
-from .xsstrike_runner import run_xsstrike_scan
-
-# Canned nuclei findings used to exercise the pipeline without external tools.
-MOCK_NUCLEI_RESULTS = [
-    {
-        "template-id": "cves/CVE-2021-1234",
-        "info": {
-            "name": "Example Vulnerable Component",
-            "severity": "high",
-        },
-        "matched-at": "http://httpbin.org/forms/post",
-        "matcher-name": "FormHandler",
-    },
-    {
-        "template-id": "misconfig/admin-panel",
-        "info": {
-            "name": "Admin Panel Exposure",
-            "severity": "medium",
-        },
-        "matched-at": "http://httpbin.org/admin/login",
-        "matcher-name": "",
-    },
-]
-
-# Mock subdomain enumeration output for amass.
-MOCK_AMASS_RESULTS = [
-    {"subdomain": "api.httpbin.org"},
-    {"subdomain": "dev.httpbin.org"},
-]
-
-# Mock ffuf directory brute-force results.
-MOCK_FFUF_RESULTS = [
-    {"ffuf": "/basic-auth/user/passwd"},
-    {"ffuf": "/bearer"},
-    {"ffuf": "/status/418"},
-]
-
-
-async def run_tool(tool_name, target, domain=None):
-    """Return canned responses after a small delay to mimic IO."""
-
-    # Simulate network/tool latency so async scheduling still matters.
-    await asyncio.sleep(0.1)
+Only the mocked runner exists today. Callers import from here so a real
+subprocess-backed implementation can be swapped in without touching them.
+"""
 
-    mocks = {
-        "nuclei": MOCK_NUCLEI_RESULTS,
-        "amass": MOCK_AMASS_RESULTS,
-        "ffuf": MOCK_FFUF_RESULTS,
-    }
-
-    return {tool_name: mocks.get(tool_name, [])}
-
-
-async def run_all_tools(target):
-    """Launch mocked tool executions concurrently and merge their outputs."""
-
-    domain = target.split("//")[1] if "//" in target else target
-
-    # Kick off each tool asynchronously; xsstrike returns its own dict payload.
-    tasks = [
-        run_tool("nuclei", target),
-        run_tool("amass", target, domain=domain),
-        run_tool("ffuf", target),
-        run_xsstrike_scan(target),
-    ]
-
-    merged = {}
-    for result in await asyncio.gather(*tasks):
-        if isinstance(result, dict):
-            merged.update(result)
-
-    return merged
+from __future__ import annotations
 
+from .mock_runner import iter_tool_results, run_all_tools, run_tool, run_xsstrike_scan
 
-__all__ = ["run_tool", "run_all_tools", "run_xsstrike_scan"]
+__all__ = ["iter_tool_results", "run_tool", "run_all_tools", "run_xsstrike_scan"]
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -10,3 +11,5 @@ def _ensure_src_on_path() -> None:
 
 
 _ensure_src_on_path()
+# Read by bountybot.tools.mock_runner at import time; skips the simulated tool latency.
+os.environ.setdefault("BOUNTYBOT_TESTING", "1")
@@ -0,0 +1,71 @@
+from bountybot.analyzer.chainsynthesizer import synthesize_attack_paths
+
+
+def _finding(role, matched_at, name="Example", tags=None):
+    finding = {"__arcanum_role": role, "matched-at": matched_at, "info": {"name": name}}
+    if tags is not None:
+        finding["tags"] = tags
+    return finding
+
+
+def test_upload_and_auth_produce_web_shell_chain():
+    findings = [
+        _finding("File Upload", "https://example.com/upload"),
+        _finding("Login/Auth Endpoint", "https://example.com/login"),
+    ]
+
+    paths = synthesize_attack_paths(findings)
+
+    assert [p["name"] for p in paths] == ["Web Shell via Weak Auth"]
+    assert paths[0]["steps"] == [0, 1]
+
+
+def test_duplicate_endpoint_pairs_produce_a_single_chain():
+    findings = [
+        _finding("File Upload", "https://example.com/upload", name="Upload A"),
+        _finding("File Upload", "https://example.com/upload", name="Upload B"),
+        _finding("Login/Auth Endpoint", "https://example.com/login"),
+    ]
+
+    paths = synthesize_attack_paths(findings)
+
+    assert len(paths) == 1
+    assert paths[0]["steps"] == [0, 2]
+
+
+def test_sqli_detected_from_tags_for_unruled_roles():
+    findings = [
+        _finding("API Endpoint", "https://example.com/api", tags=["sqli"]),
+        _finding("Login/Auth Endpoint", "https://example.com/login"),
+    ]
+
+    paths = synthesize_attack_paths(findings)
+
+    assert [p["name"] for p in paths] == ["Database Breach to Session Stealing"]
+    assert paths[0]["steps"] == [0, 1]
+
+
+def test_sqli_detected_from_comma_separated_tag_string():
+    findings = [
+        _finding("API Endpoint", "https://example.com/api", tags="xss, sqli"),
+        _finding("Login/Auth Endpoint", "https://example.com/login"),
+    ]
+
+    paths = synthesize_attack_paths(findings)
+
+    assert [p["name"] for p in paths] == ["Database Breach to Session Stealing"]
+
+
+def test_debug_page_needs_an_admin_panel_to_chain():
+    debug = _finding("Debug/Logging", "https://example.com/debug")
+    admin = _finding("Admin Panel", "https://example.com/admin")
+
+    assert synthesize_attack_paths([debug]) == []
+
+    paths = synthesize_attack_paths([debug, admin])
+    assert [p["name"] for p in paths] == ["Internal Recon Lead via Debug Info"]
+    assert paths[0]["steps"] == [0, 1]
+
+
+def test_no_findings_yield_no_paths():
+    assert synthesize_attack_paths([]) == []
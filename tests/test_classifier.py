@@ -0,0 +1,73 @@
+import pytest
+
+from bountybot.analyzer import classifier
+from bountybot.analyzer.classifier import classify_findings, clear_role_cache, role_for
+from bountybot.scanner.intelligence import classify_finding
+
+
+@pytest.fixture(autouse=True)
+def _fresh_role_cache():
+    clear_role_cache()
+    yield
+    clear_role_cache()
+
+
+def test_role_for_distinguishes_urls_for_the_same_template():
+    login = {"template-id": "generic/exposure", "matched-at": "https://example.com/login"}
+    admin = {"template-id": "generic/exposure", "matched-at": "https://example.com/admin"}
+
+    assert role_for(login) == "Login/Auth Endpoint"
+    assert role_for(admin) == "Admin Panel"
+
+
+def test_role_for_reuses_cached_roles(monkeypatch):
+    calls = []
+    real = classifier.determine_endpoint_role
+
+    def counting(finding, **kwargs):
+        calls.append(finding)
+        return real(finding, **kwargs)
+
+    monkeypatch.setattr(classifier, "determine_endpoint_role", counting)
+    finding = {"template-id": "generic/exposure", "matched-at": "https://example.com/login"}
+
+    assert role_for(finding) == "Login/Auth Endpoint"
+    assert role_for(dict(finding)) == "Login/Auth Endpoint"
+    assert len(calls) == 1
+
+    role_for({"matched-at": "https://example.com/login"})
+    role_for({"matched-at": "https://example.com/login"})
+    assert len(calls) == 3  # findings without a template-id are never cached
+
+
+def test_classify_findings_tags_each_finding_in_place():
+    findings = [
+        {"matched-at": "https://example.com/upload"},
+        {"info": {"name": "Grafana Dashboard"}},
+    ]
+
+    assert classify_findings(findings) is findings
+    assert [f["__arcanum_role"] for f in findings] == ["File Upload", "Admin Panel"]
+
+
+def test_classify_finding_uses_the_role_cache(monkeypatch):
+    calls = []
+    real = classifier.determine_endpoint_role
+
+    def counting(finding, **kwargs):
+        calls.append(kwargs["_prepared"])
+        return real(finding, **kwargs)
+
+    monkeypatch.setattr(classifier, "determine_endpoint_role", counting)
+    finding = {
+        "template-id": "generic/exposure",
+        "info": {"name": "Debug endpoint"},
+        "matched-at": "https://example.com/admin",
+    }
+
+    first = classify_finding(finding, role_for=role_for)
+    second = classify_finding(dict(finding), role_for=role_for)
+
+    assert first == second == ("Admin Panel", ["Debug Information Leak", "Sensitive Role: Admin Panel"])
+    assert len(calls) == 1
+    assert calls[0] is not None  # the text collected for insights is reused on a miss
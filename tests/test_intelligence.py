@@ -0,0 +1,69 @@
+import ast
+import inspect
+from collections import Counter
+
+from bountybot.scanner import intelligence
+from bountybot.scanner.intelligence import (
+    classify_finding,
+    determine_endpoint_role,
+    infer_insights,
+)
+
+
+def test_intelligence_has_single_definition():
+    tree = ast.parse(inspect.getsource(intelligence))
+    functions = Counter(
+        node.name for node in tree.body if isinstance(node, ast.FunctionDef)
+    )
+    exports = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and any(getattr(target, "id", None) == "__all__" for target in node.targets)
+    ]
+
+    assert [name for name, count in functions.items() if count > 1] == []
+    assert len(exports) == 1
+    for name in intelligence.__all__:
+        assert getattr(intelligence, name).__module__ == intelligence.__name__
+
+
+def test_classify_finding_matches_separate_calls():
+    finding = {
+        "template-id": "CVE-2021-0001",
+        "info": {"name": "Blind SQL", "severity": "high", "tags": ["sqli"]},
+        "matched-at": "https://example.com/admin",
+    }
+
+    role, insights = classify_finding(finding)
+
+    assert "__arcanum_role" not in finding
+    finding["__arcanum_role"] = determine_endpoint_role(finding)
+    assert role == finding["__arcanum_role"] == "Admin Panel"
+    assert insights == infer_insights(finding["template-id"], finding)
+    assert insights[:3] == ["SQLi Suspected", "High Priority", "CVE Coverage"]
+
+
+def test_keywords_match_whole_words_only():
+    assert "Session Token Exposure" in infer_insights(None, {"info": {"name": "Leaked token"}})
+    assert "Session Token Exposure" not in infer_insights(None, {"info": {"name": "Tokenizer"}})
+    assert determine_endpoint_role({"info": {"name": "Catalog API"}}) == "API Endpoint"
+    assert determine_endpoint_role({"info": {"name": "Unrestricted File Uploads"}}) == "File Upload"
+    assert determine_endpoint_role({"info": {"name": "WordPress Administrator Panel"}}) == "Admin Panel"
+    assert determine_endpoint_role({"info": {"name": "Passwords in JS"}}) == "Login/Auth Endpoint"
+    assert "Session Token Exposure" in infer_insights(None, {"info": {"name": "Leaked API tokens"}})
+    assert "Debug Information Leak" in infer_insights(None, {"info": {"name": "Debugging Endpoint Enabled"}})
+    assert "Open Redirect" in infer_insights(None, {"info": {"name": "Open Redirects"}})
+    assert determine_endpoint_role({"info": {"name": "file_upload"}}) == "File Upload"
+
+
+def test_distinctive_keywords_still_match_inside_words():
+    assert determine_endpoint_role(
+        {"template-id": "phpmyadmin-panel", "info": {"name": "phpMyAdmin Panel"}}
+    ) == "Admin Panel"
+    for name in ("adminer", "cmsms", "Administrative interface"):
+        assert determine_endpoint_role({"info": {"name": name}}) == "Admin Panel"
+    assert determine_endpoint_role({"info": {"name": "Unauthenticated access"}}) == "Login/Auth Endpoint"
+    assert determine_endpoint_role({"info": {"name": "WP Uploader"}}) == "File Upload"
+    assert "Debug Information Leak" in infer_insights(None, {"info": {"name": "Debugger"}})
+    assert "RCE Potential" not in infer_insights(None, {"info": {"name": "Source code disclosure"}})
@@ -0,0 +1,79 @@
+import asyncio
+import importlib
+import sys
+import types
+
+import pytest
+
+
+_MODULE = "bountybot.tools.mock_runner"
+
+
+@pytest.fixture
+def import_mock_runner(monkeypatch):
+    """Import a fresh mock runner with a stand-in xsstrike module, undone afterwards."""
+
+    async def run_xsstrike_scan(target):
+        return {"xsstrike": [{"url": target}]}
+
+    stub = types.ModuleType("bountybot.tools.xsstrike_runner")
+    stub.run_xsstrike_scan = run_xsstrike_scan
+    monkeypatch.setitem(sys.modules, "bountybot.tools.xsstrike_runner", stub)
+
+    package = importlib.import_module("bountybot.tools")
+    previous = sys.modules.pop(_MODULE, None)
+    previous_attr = package.__dict__.get("mock_runner")
+
+    def load():
+        sys.modules.pop(_MODULE, None)
+        return importlib.import_module(_MODULE)
+
+    yield load
+
+    # The module imported here is bound to the stub; never leave it behind.
+    sys.modules.pop(_MODULE, None)
+    if previous is not None:
+        sys.modules[_MODULE] = previous
+    if previous_attr is not None:
+        package.mock_runner = previous_attr
+    else:
+        package.__dict__.pop("mock_runner", None)
+
+
+@pytest.fixture
+def mock_runner(import_mock_runner):
+    return import_mock_runner()
+
+
+def test_testing_env_disables_latency(mock_runner):
+    assert mock_runner.TESTING
+    assert mock_runner.MOCK_LATENCY == 0.0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1", True), ("true", True), ("YES", True), ("0", False), ("false", False), ("", False)],
+)
+def test_testing_env_accepts_only_truthy_values(import_mock_runner, monkeypatch, value, expected):
+    monkeypatch.setenv("BOUNTYBOT_TESTING", value)
+    assert import_mock_runner().TESTING is expected
+
+
+def test_run_tool_returns_canned_results(mock_runner):
+    result = asyncio.run(mock_runner.run_tool("nuclei", "http://httpbin.org"))
+    assert result == {"nuclei": mock_runner.MOCK_NUCLEI_RESULTS}
+
+    assert asyncio.run(mock_runner.run_tool("unknown", "http://httpbin.org")) == {"unknown": ()}
+
+
+def test_run_all_tools_merges_every_tool(mock_runner):
+    results = asyncio.run(mock_runner.run_all_tools("http://httpbin.org"))
+
+    assert set(results) == {"nuclei", "amass", "ffuf", "xsstrike"}
+    assert results["amass"] == mock_runner.MOCK_AMASS_RESULTS
+    assert results["xsstrike"] == [{"url": "http://httpbin.org"}]
+
+
+def test_fixture_does_not_leak_the_stubbed_module():
+    assert _MODULE not in sys.modules
+    assert "bountybot.tools.xsstrike_runner" not in sys.modules
@@ -0,0 +1,59 @@
+import pytest
+
+from bountybot.data import model
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "memory.db"
+    monkeypatch.setattr(model, "DB_PATH", str(path))
+    model.init_db()
+    yield path
+    model.close_db()
+
+
+def test_connection_follows_db_path_changes(db_path, tmp_path, monkeypatch):
+    model.log_attack_result("first", "success", ["a"])
+
+    other = tmp_path / "other.db"
+    monkeypatch.setattr(model, "DB_PATH", str(other))
+    model.init_db()
+    model.log_attack_result("second", "success", ["b"])
+
+    assert other.exists()
+    assert model.retrieve_successful_chains() == [("second", ["b"])]
+
+    monkeypatch.setattr(model, "DB_PATH", str(db_path))
+    assert model.retrieve_successful_chains() == [("first", ["a"])]
+
+
+def test_close_db_resets_the_shared_connection(db_path):
+    model.log_attack_result("kept", "success", [])
+    model.close_db()
+
+    assert model.retrieve_successful_chains() == [("kept", [])]
+
+
+def test_bulk_log_inserts_every_row(db_path):
+    model.log_attack_results_bulk(
+        [
+            ("upload chain", "success", ["tested", "shell_upload"]),
+            ("sqli chain", "success", ["tested", "sqli"]),
+            ("admin chain", "denied", ["tested"]),
+        ]
+    )
+
+    assert model.retrieve_successful_chains() == [
+        ("upload chain", ["tested", "shell_upload"]),
+        ("sqli chain", ["tested", "sqli"]),
+    ]
+
+
+def test_failed_bulk_log_rolls_back_and_leaves_connection_usable(db_path):
+    with pytest.raises(Exception):
+        # The dict description cannot be bound, so the batch fails mid-transaction.
+        model.log_attack_results_bulk([("ok", "success", []), ({"bad": 1}, "success", [])])
+
+    model.log_attack_results_bulk([("after", "success", [])])
+
+    assert model.retrieve_successful_chains() == [("after", [])]
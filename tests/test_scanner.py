@@ -1,17 +1,49 @@
+import asyncio
+import os
+import time
+
 import pytest
 
 from bountybot.scanner.nuclei_runner import (
     DEFAULT_PROFILE,
+    NucleiNotInstalled,
+    NucleiScanFailed,
+    NucleiScanTimeout,
     available_profiles,
     build_nuclei_command,
+    run_nuclei_scan_async,
 )
 
 
+@pytest.fixture
+def fake_nuclei(tmp_path, monkeypatch):
+    """Install a shell script named `nuclei` ahead of everything else on PATH."""
+
+    def install(body: str):
+        script = tmp_path / "nuclei"
+        script.write_text("#!/bin/sh\n" + body)
+        script.chmod(0o755)
+        return script
+
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    return install
+
+
+def _scan(**kwargs):
+    return asyncio.run(run_nuclei_scan_async("https://example.com", **kwargs))
+
+
 def test_default_profile_is_registered():
     profiles = available_profiles()
     assert DEFAULT_PROFILE in profiles
 
 
+def test_available_profiles_is_read_only():
+    profiles = available_profiles()
+    with pytest.raises(TypeError):
+        profiles["custom"] = profiles[DEFAULT_PROFILE]
+
+
 def test_build_command_includes_base_arguments():
     target = "https://example.com"
     cmd = build_nuclei_command(target)
@@ -37,3 +69,74 @@ def test_build_command_thorough_profile_has_no_filters():
 def test_build_command_errors_on_unknown_profile():
     with pytest.raises(ValueError):
         build_nuclei_command("https://example.com", profile="does-not-exist")
+
+
+def test_scan_parses_jsonl_and_skips_bad_lines(fake_nuclei, capsys):
+    fake_nuclei(
+        "printf '%s\\n' '{\"template-id\": \"a\"}' 'not json' ''\n"
+        "printf '\\377\\376\\n'\n"
+        "printf '%s\\n' '{\"template-id\": \"b\"}'\n"
+        "echo 'progress 50%' >&2\n"
+        "echo 'done' >&2\n"
+    )
+
+    result = _scan()
+
+    assert [f["template-id"] for f in result.findings] == ["a", "b"]
+    assert result.stderr_tail == ["progress 50%", "done"]
+    assert result.command == build_nuclei_command("https://example.com")
+    assert "Skipped 2 non-JSON line(s)" in capsys.readouterr().out
+
+
+def test_scan_skips_lines_over_the_stream_limit(fake_nuclei, capsys):
+    fake_nuclei(
+        "printf '%s\\n' '{\"template-id\": \"a\"}'\n"
+        "head -c 17825792 /dev/zero | tr '\\000' x\n"
+        "printf '\\n%s\\n' '{\"template-id\": \"b\"}'\n"
+    )
+
+    result = _scan()
+
+    assert [f["template-id"] for f in result.findings] == ["a", "b"]
+    assert "Skipped 1 non-JSON line(s)" in capsys.readouterr().out
+
+
+def test_scan_keeps_only_the_stderr_tail(fake_nuclei):
+    fake_nuclei("i=0; while [ $i -lt 50 ]; do echo \"line $i\" >&2; i=$((i+1)); done\n")
+
+    result = _scan()
+
+    assert len(result.stderr_tail) == 40
+    assert result.stderr_tail[0] == "line 10"
+    assert result.stderr_tail[-1] == "line 49"
+
+
+def test_scan_timeout_kills_the_child(fake_nuclei, tmp_path):
+    pid_file = tmp_path / "pid"
+    fake_nuclei(f"echo $$ > {pid_file}\nexec sleep 5\n")
+
+    start = time.monotonic()
+    with pytest.raises(NucleiScanTimeout) as excinfo:
+        _scan(timeout=0.5)
+
+    assert time.monotonic() - start < 3
+    assert excinfo.value.timeout == 0.5
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+def test_scan_failure_reports_returncode_and_stderr(fake_nuclei):
+    fake_nuclei("echo 'bad flag' >&2\nexit 3\n")
+
+    with pytest.raises(NucleiScanFailed) as excinfo:
+        _scan()
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stderr_tail == ["bad flag"]
+
+
+def test_scan_without_nuclei_on_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    with pytest.raises(NucleiNotInstalled):
+        _scan()